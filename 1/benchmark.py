@@ -0,0 +1,46 @@
+import random
+from time import perf_counter
+from main import distance, similarity
+
+SIZES = [10_000, 100_000, 1_000_000]
+LOOP_SAMPLE = 1_000
+
+def loop_solve(list1, list2, sample = None):
+    list1 = sorted(list1)
+    list2 = sorted(list2)
+
+    sum = 0
+    sim = 0
+    for i in range(len(list1) if sample is None else sample):
+        sum += abs(list1[i] - list2[i])
+        sim += list1[i] * list2.count(list1[i])
+
+    return sum, sim
+
+def time_it(func, *args):
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+def generate(size):
+    list1 = [random.randint(10000, 99999) for _ in range(size)]
+    list2 = [random.randint(10000, 99999) for _ in range(size)]
+    return list1, list2
+
+list1, list2 = generate(LOOP_SAMPLE)
+assert loop_solve(list1, list2) == (distance(list1, list2), similarity(list1, list2))
+
+print(f"{'rows':>10} {'loop (s)':>12} {'indexed (s)':>12} {'speedup':>10}")
+for size in SIZES:
+    list1, list2 = generate(size)
+
+    # The count() scan is quadratic, so past the sample size only part of the loop is timed and scaled up
+    if size <= LOOP_SAMPLE * 10:
+        loop_time = time_it(loop_solve, list1, list2)
+        estimated = ""
+    else:
+        loop_time = time_it(loop_solve, list1, list2, LOOP_SAMPLE) * size / LOOP_SAMPLE
+        estimated = "~"
+
+    indexed_time = time_it(distance, list1, list2) + time_it(similarity, list1, list2)
+    print(f"{size:>10} {estimated + f'{loop_time:.3f}':>12} {indexed_time:>12.3f} {loop_time / indexed_time:>9.0f}x")
@@ -0,0 +1,91 @@
+import heapq
+import tempfile
+from array import array
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
+
+MEMORY_LIMIT = 64 * 1024 * 1024
+ITEM_SIZE = array("q").itemsize
+
+def spill(column):
+    np.frombuffer(column, dtype = np.int64).sort()
+    run = tempfile.TemporaryFile()
+    column.tofile(run)
+    run.seek(0)
+    return run
+
+def split_runs(file, memory_limit):
+    chunk_rows = max(1, memory_limit // (2 * ITEM_SIZE))
+    runs1 = []
+    runs2 = []
+    with open(file) as f:
+        list1 = array("q")
+        list2 = array("q")
+        for line in f:
+            nums = line.split("   ")
+            list1.append(int(nums[0]))
+            list2.append(int(nums[1]))
+
+            if len(list1) == chunk_rows:
+                runs1.append(spill(list1))
+                runs2.append(spill(list2))
+                list1 = array("q")
+                list2 = array("q")
+
+        if list1:
+            runs1.append(spill(list1))
+            runs2.append(spill(list2))
+
+    return runs1, runs2
+
+def read_run(run, buffer_items):
+    while True:
+        buffer = array("q")
+        try:
+            buffer.fromfile(run, buffer_items)
+        except EOFError:
+            yield from buffer
+            run.close()
+            return
+        yield from buffer
+
+def merge_runs(runs, buffer_items):
+    return heapq.merge(*[read_run(run, buffer_items) for run in runs])
+
+def count_values(stream, side):
+    for value, group in groupby(stream):
+        yield value, side, sum(1 for _ in group)
+
+def solve(file, memory_limit = MEMORY_LIMIT):
+    runs1, runs2 = split_runs(file, memory_limit)
+    buffer_items = max(1, memory_limit // (ITEM_SIZE * max(1, len(runs1) + len(runs2))))
+    list1 = count_values(merge_runs(runs1, buffer_items), 0)
+    list2 = count_values(merge_runs(runs2, buffer_items), 1)
+
+    # With equally sized lists the paired distance equals the area between their
+    # cumulative counts, so both parts come out of one merge ordered by value
+    sum = 0
+    sim = 0
+    balance = 0
+    previous = 0
+    for value, counts in groupby(heapq.merge(list1, list2), key = itemgetter(0)):
+        sum += abs(balance) * (value - previous)
+        count1 = count2 = 0
+        for _, side, count in counts:
+            if side == 0:
+                count1 = count
+            else:
+                count2 = count
+
+        sim += value * count1 * count2
+        balance += count1 - count2
+        previous = value
+
+    return sum, sim
+
+if __name__ == "__main__":
+    sum, sim = solve("1/input.txt")
+
+    print(f"Part 1: {sum}")
+    print(f"Part 2: {sim}")
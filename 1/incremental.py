@@ -0,0 +1,110 @@
+import bisect
+from collections import Counter
+
+BLOCK_SIZE = 256
+
+# Like external_sort.solve, the distance is kept in value space: it is the sum over every value v
+# of |d(v)|, where d(v) is how many more entries up to v list1 has than list2. An update moves d by
+# one from its value up, so d is split into blocks, each with a lazy offset and a sorted copy of its
+# cells, and the cells that move towards zero are counted with one bisect per block
+class LocationLists:
+    def __init__(self, pairs = ()):
+        self.cells = []
+        self.sorted_cells = []
+        self.offsets = []
+        self.counts1 = Counter()
+        self.counts2 = Counter()
+        self.length = 0
+        self.distance = 0
+        self.similarity = 0
+
+        pairs = list(pairs)
+        if pairs:
+            self.load(pairs)
+
+    # Builds d with one running sum over the values instead of one update per pair
+    def load(self, pairs):
+        self.grow(min(min(pair) for pair in pairs), max(max(pair) for pair in pairs))
+        for num1, num2 in pairs:
+            self.counts1[num1] += 1
+            self.counts2[num2] += 1
+
+        d = 0
+        for block, cells in enumerate(self.cells):
+            for i in range(BLOCK_SIZE):
+                value = block * BLOCK_SIZE + i
+                d += self.counts1[value] - self.counts2[value]
+                cells[i] = d
+                self.distance += abs(d)
+            self.sorted_cells[block] = sorted(cells)
+
+        self.length = len(pairs)
+        self.similarity = sum(num * count * self.counts2[num] for num, count in self.counts1.items())
+
+    # Only called while both lists are the same length, so d is 0 past every entry
+    def grow(self, low, high):
+        if low < 0:
+            raise ValueError(f"{low} is not a location ID")
+        while len(self.cells) * BLOCK_SIZE <= high:
+            self.cells.append([0] * BLOCK_SIZE)
+            self.sorted_cells.append([0] * BLOCK_SIZE)
+            self.offsets.append(0)
+
+    def shift(self, value, change):
+        block, start = divmod(value, BLOCK_SIZE)
+        cells = self.cells[block]
+        offset = self.offsets[block]
+        towards_zero = 0
+        for i in range(start, BLOCK_SIZE):
+            if (cells[i] + offset) * change < 0:
+                towards_zero += 1
+            cells[i] += change
+        self.sorted_cells[block] = sorted(cells)
+
+        for later in range(block + 1, len(self.cells)):
+            offset = self.offsets[later]
+            if change > 0:
+                towards_zero += bisect.bisect_left(self.sorted_cells[later], -offset)
+            else:
+                towards_zero += BLOCK_SIZE - bisect.bisect_right(self.sorted_cells[later], -offset)
+            self.offsets[later] = offset + change
+
+        shifted = len(self.cells) * BLOCK_SIZE - value
+        self.distance += shifted - 2 * towards_zero
+
+    def add(self, num1, num2):
+        self.grow(min(num1, num2), max(num1, num2))
+        self.shift(num1, 1)
+        self.shift(num2, -1)
+        self.length += 1
+
+        self.similarity += num1 * self.counts2[num1]
+        self.counts1[num1] += 1
+        self.similarity += num2 * self.counts1[num2]
+        self.counts2[num2] += 1
+
+    def remove(self, num1, num2):
+        if not self.counts1[num1] or not self.counts2[num2]:
+            raise ValueError(f"({num1}, {num2}) is not in the lists")
+
+        self.shift(num1, -1)
+        self.shift(num2, 1)
+        self.length -= 1
+
+        self.counts2[num2] -= 1
+        self.similarity -= num2 * self.counts1[num2]
+        self.counts1[num1] -= 1
+        self.similarity -= num1 * self.counts2[num1]
+
+    def __len__(self):
+        return self.length
+
+if __name__ == "__main__":
+    lists = LocationLists()
+    with open("1/input.txt") as f:
+        for line in f:
+            nums = line.split("   ")
+            lists.add(int(nums[0]), int(nums[1]))
+
+    print(f"Part 1: {lists.distance}")
+    print(f"Part 2: {lists.similarity}")
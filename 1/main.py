@@ -1,19 +1,28 @@
-with open("1/input.txt") as f:
+from collections import Counter
+import numpy as np
+
+def read_lists(file):
     list1 = []
     list2 = []
-    for line in f:
-        nums = line.split("   ")
-        list1.append(int(nums[0]))
-        list2.append(int(nums[1]))
+    with open(file) as f:
+        for line in f:
+            nums = line.split("   ")
+            list1.append(int(nums[0]))
+            list2.append(int(nums[1]))
+
+    return list1, list2
+
+def distance(list1, list2):
+    list1 = np.sort(np.array(list1, dtype = np.int64))
+    list2 = np.sort(np.array(list2, dtype = np.int64))
+    return int(np.abs(list1 - list2).sum())
+
+def similarity(list1, list2):
+    counts = Counter(list2)
+    return sum(num * counts[num] for num in list1)
 
-    list1.sort()
-    list2.sort()
-    
-    sum = 0
-    sim = 0
-    for i in range(len(list1)):
-        sum += abs(list1[i] - list2[i])
-        sim += list1[i] * list2.count(list1[i])
+if __name__ == "__main__":
+    list1, list2 = read_lists("1/input.txt")
 
-    print(f"Part 1: {sum}")
-    print(f"Part 2: {sim}")
\ No newline at end of file
+    print(f"Part 1: {distance(list1, list2)}")
+    print(f"Part 2: {similarity(list1, list2)}")
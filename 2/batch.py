@@ -0,0 +1,78 @@
+import numpy as np
+
+class ReportBatch:
+    def __init__(self, levels, lengths):
+        self.levels = np.asarray(levels, dtype = np.int64)
+        self.lengths = np.asarray(lengths, dtype = np.int64)
+        self.starts = np.cumsum(self.lengths) - self.lengths
+        self.ends = self.starts + self.lengths - 1
+
+        # diffs[i] is levels[i + 1] - levels[i], which only means something inside one report
+        self.diffs = np.diff(self.levels)
+        self.in_report = np.ones(len(self.diffs), dtype = bool)
+        boundaries = self.ends[self.lengths > 0]
+        self.in_report[boundaries[boundaries < len(self.diffs)]] = False
+
+    # Every line is a report, like iterating the file in main.py, and its levels are the
+    # whitespace separated tokens on it, so a blank line is an empty report
+    @staticmethod
+    def load(file):
+        with open(file, "rb") as f:
+            return ReportBatch.parse(f.read())
+
+    @staticmethod
+    def parse(data):
+        chars = np.frombuffer(data, dtype = np.uint8)
+        separators = chars <= ord(" ")
+        token_starts = np.flatnonzero(~separators & np.concatenate(([True], separators[:-1])))
+        newlines = np.flatnonzero(chars == ord("\n"))
+
+        line_count = len(newlines) + (1 if data and not data.endswith(b"\n") else 0)
+        lengths = np.bincount(np.searchsorted(newlines, token_starts), minlength = line_count)
+        # fromstring reads a lone 0 out of whitespace-only data
+        levels = np.fromstring(data, dtype = np.int64, sep = " ") if lengths.sum() else np.zeros(0, dtype = np.int64)
+        if len(levels) != lengths.sum():
+            raise ValueError(f"found {lengths.sum()} levels but only {len(levels)} could be parsed")
+
+        return ReportBatch(levels, lengths)
+
+    def is_step(self, diff, sign):
+        return (1 <= diff * sign) & (diff * sign <= 3)
+
+    def check_direction(self, sign):
+        bad = np.flatnonzero(self.in_report & ~self.is_step(self.diffs, sign))
+        if len(bad) == 0:
+            safe = np.ones(len(self.lengths), dtype = bool)
+            return safe, safe
+
+        first_pos = np.searchsorted(bad, self.starts)
+        last_pos = np.searchsorted(bad, self.ends) - 1
+        first = bad[np.minimum(first_pos, len(bad) - 1)]
+        last = bad[np.maximum(last_pos, 0)]
+        safe = (first_pos == len(bad)) | (first >= self.ends)
+
+        # A single removal has to break up the first bad pair (first, first + 1):
+        # dropping `first` needs no later bad steps and a valid bridge over it,
+        # dropping `first + 1` tolerates one more bad step right after it
+        first = np.where(safe, 0, first)
+        last = np.where(safe, 0, last)
+        n = len(self.levels)
+        before = self.levels[np.maximum(first - 1, 0)]
+        after = self.levels[np.minimum(first + 2, n - 1)]
+        drop_first = (last == first) & ((first == self.starts) |
+                                        self.is_step(self.levels[np.minimum(first + 1, n - 1)] - before, sign))
+        drop_next = (last <= first + 1) & ((first + 1 == self.ends) |
+                                           self.is_step(after - self.levels[first], sign))
+
+        return safe, safe | drop_first | drop_next
+
+    def count_safe(self):
+        safe_up, dampened_up = self.check_direction(1)
+        safe_down, dampened_down = self.check_direction(-1)
+
+        return int((safe_up | safe_down).sum()), int((dampened_up | dampened_down).sum())
+
+if __name__ == "__main__":
+    safe_reports, dampened_safe_reports = ReportBatch.load("2/input.txt").count_safe()
+
+    print(f"Part 1: {safe_reports}\nPart 2: {dampened_safe_reports}")
@@ -0,0 +1,84 @@
+import math
+import random
+from time import perf_counter
+from main import is_safe, parse_report
+from batch import ReportBatch
+
+SIZES = [10, 1_000, 100_000]
+LEVELS_PER_SIZE = 200_000
+LOOP_LIMIT = 100
+
+def loop_is_safe(report, dampened = False):
+    sign = None
+    safe = True
+    for i in range(len(report) - 1):
+        a = int(report[i])
+        b = int(report[i + 1])
+        diff = a - b
+
+        if sign is not None and sign != math.copysign(1, diff):
+            safe = False
+
+        sign = math.copysign(1, diff)
+        diff = abs(diff)
+
+        if diff < 1 or diff > 3:
+            safe = False
+
+    if dampened and not safe:
+        for i in range(len(report)):
+            dampened_report = report.copy()
+            dampened_report.pop(i)
+            if loop_is_safe(dampened_report):
+                return True
+
+    return safe
+
+# Two bad jumps far apart make the report unsafe even when dampened, the worst case for the loop
+def generate(size):
+    level = random.randint(1, 100)
+    report = [level]
+    for i in range(1, size):
+        level += 10 if i in (size // 3, 2 * size // 3) else random.randint(1, 3)
+        report.append(level)
+
+    return " ".join(str(level) for level in report)
+
+def time_it(func, lines):
+    start = perf_counter()
+    func(lines)
+    return perf_counter() - start
+
+def loop_solve(lines):
+    return [loop_is_safe(line.split(), True) for line in lines]
+
+def dp_solve(lines):
+    return [is_safe(parse_report(line), tolerance = 1) for line in lines]
+
+for _ in range(1000):
+    line = " ".join(str(random.randint(1, 12)) for _ in range(random.randint(1, 8)))
+    assert loop_is_safe(line.split(), True) == is_safe(parse_report(line), tolerance = 1), line
+
+# Trailing whitespace and blank lines have to split into reports the same way main.py does
+data = "7 6 4 2 1 \n1 2 7 8 9\n\n9 7 6 2 1\t\n1 3 2 4 5\n  \n8 6 4 4 1\n1 3 6 7 9\n\n"
+reports = [parse_report(line) for line in data.splitlines()]
+expected = (sum(is_safe(report) for report in reports), sum(is_safe(report, tolerance = 1) for report in reports))
+assert ReportBatch.parse(data.encode()).count_safe() == expected, expected
+
+print(f"{'levels':>10} {'loop (s)':>12} {'dp (s)':>12} {'speedup':>10}")
+for size in SIZES:
+    lines = [generate(size) for _ in range(max(1, LEVELS_PER_SIZE // size))]
+
+    # Past the limit a single undampened check is timed and scaled by the number of removals tried
+    if size <= LOOP_LIMIT:
+        loop_time = time_it(loop_solve, lines)
+        estimated = ""
+    else:
+        start = perf_counter()
+        for line in lines:
+            loop_is_safe(line.split())
+        loop_time = (perf_counter() - start) * (size + 1)
+        estimated = "~"
+
+    dp_time = time_it(dp_solve, lines)
+    print(f"{size:>10} {estimated + f'{loop_time:.3f}':>12} {dp_time:>12.3f} {loop_time / dp_time:>9.0f}x")
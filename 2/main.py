@@ -1,41 +1,40 @@
-import math
-
-def is_safe(report, dampened = False):
-    sign = None
-    safe = True
-    for i in range(len(report) - 1):
-        a = int(report[i])
-        b = int(report[i + 1])
-        diff = a - b
-
-        if sign is not None and sign != math.copysign(1, diff):
-            safe = False
-
-        sign = math.copysign(1, diff) 
-        diff = abs(diff)
-
-        if diff < 1 or diff > 3:
-            safe = False
-        
-    if dampened and not safe:
-        for i in range(len(report)):
-            dampened_report = report.copy()
-            dampened_report.pop(i)
-            if is_safe(dampened_report):
+def is_safe(report, tolerance = 0):
+    if not report:
+        return True
+
+    last_index = len(report) - 1
+    for sign in (1, -1):
+        # removals[i] is the fewest levels dropped so far if level i is kept,
+        # and a kept level can only follow one of the tolerance + 1 levels before it
+        removals = []
+        for i, level in enumerate(report):
+            fewest = i
+            for last in range(max(0, i - 1 - tolerance), i):
+                dropped = removals[last] + i - last - 1
+                if dropped < fewest and 1 <= (level - report[last]) * sign <= 3:
+                    fewest = dropped
+
+            removals.append(fewest)
+
+        for last in range(max(0, last_index - tolerance), last_index + 1):
+            if removals[last] + last_index - last <= tolerance:
                 return True
 
-    return safe
-
-with open("2/input.txt") as f:
-    reports = f.readlines()
-    
-    safe_reports = 0
-    dampened_safe_reports = 0
-    for report in reports:
-        report = report.strip().split(" ")
-        if is_safe(report):
-            safe_reports += 1
-        if is_safe(report, True):
-            dampened_safe_reports += 1
-
-    print(f"Part 1: {safe_reports}\nPart 2: {dampened_safe_reports}")
+    return False
+
+def parse_report(line):
+    return [int(level) for level in line.split()]
+
+if __name__ == "__main__":
+    with open("2/input.txt") as f:
+        reports = [parse_report(line) for line in f]
+
+        safe_reports = 0
+        dampened_safe_reports = 0
+        for report in reports:
+            if is_safe(report):
+                safe_reports += 1
+            if is_safe(report, tolerance = 1):
+                dampened_safe_reports += 1
+
+        print(f"Part 1: {safe_reports}\nPart 2: {dampened_safe_reports}")
@@ -0,0 +1,60 @@
+import mmap
+import os
+from multiprocessing import Pool
+from streaming import INSTRUCTION, LONGEST_INSTRUCTION
+
+SHARDS_PER_PROCESS = 4
+
+# Summarises a shard without knowing whether it starts enabled: products before the
+# first toggle only count if it was entered enabled, the rest are already decided
+def scan_shard(file, start, end):
+    p1_prod_sum = 0
+    before_toggle = 0
+    after_toggle = 0
+    enabled = None
+    with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as memory:
+        for instr in INSTRUCTION.finditer(memory, start, min(len(memory), end + LONGEST_INSTRUCTION - 1)):
+            if instr.start() >= end:
+                break
+
+            if instr[3]:
+                enabled = True
+            elif instr[4]:
+                enabled = False
+            else:
+                prod = int(instr[1]) * int(instr[2])
+                p1_prod_sum += prod
+                if enabled is None:
+                    before_toggle += prod
+                elif enabled:
+                    after_toggle += prod
+
+    return p1_prod_sum, before_toggle, after_toggle, enabled
+
+def scan_file(file, processes = None):
+    size = os.path.getsize(file)
+    if size == 0:
+        return 0, 0
+
+    processes = processes or os.cpu_count()
+    shard_size = max(LONGEST_INSTRUCTION, -(-size // (processes * SHARDS_PER_PROCESS)))
+    shards = [(file, start, min(size, start + shard_size)) for start in range(0, size, shard_size)]
+
+    with Pool(processes) as pool:
+        summaries = pool.starmap(scan_shard, shards)
+
+    p1_prod_sum = 0
+    p2_prod_sum = 0
+    enabled = True
+    for p1, before_toggle, after_toggle, last_toggle in summaries:
+        p1_prod_sum += p1
+        p2_prod_sum += after_toggle + (before_toggle if enabled else 0)
+        if last_toggle is not None:
+            enabled = last_toggle
+
+    return p1_prod_sum, p2_prod_sum
+
+if __name__ == "__main__":
+    p1_prod_sum, p2_prod_sum = scan_file("3/input.txt")
+
+    print(f"Part 1: {p1_prod_sum}", f"Part 2: {p2_prod_sum}", sep="\n")
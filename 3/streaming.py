@@ -0,0 +1,50 @@
+import re
+
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+LONGEST_INSTRUCTION = len("mul(123,456)")
+CHUNK_SIZE = 1024 * 1024
+
+def scan(memory, enabled = True, end = None):
+    p1_prod_sum = 0
+    p2_prod_sum = 0
+    for instr in INSTRUCTION.finditer(memory):
+        if end is not None and instr.start() >= end:
+            break
+
+        if instr[3]:
+            enabled = True
+        elif instr[4]:
+            enabled = False
+        else:
+            prod = int(instr[1]) * int(instr[2])
+            p1_prod_sum += prod
+            if enabled:
+                p2_prod_sum += prod
+
+    return p1_prod_sum, p2_prod_sum, enabled
+
+def scan_file(file, chunk_size = CHUNK_SIZE):
+    p1_prod_sum = 0
+    p2_prod_sum = 0
+    enabled = True
+    with open(file, "rb") as f:
+        tail = b""
+        while True:
+            chunk = f.read(chunk_size)
+            memory = tail + chunk
+            if not chunk:
+                p1, p2, enabled = scan(memory, enabled)
+                return p1_prod_sum + p1, p2_prod_sum + p2, enabled
+
+            # Instructions never overlap, so anything starting this far from the end is
+            # complete, and the rest is carried over to be matched with the next chunk
+            end = max(0, len(memory) - LONGEST_INSTRUCTION + 1)
+            p1, p2, enabled = scan(memory, enabled, end)
+            p1_prod_sum += p1
+            p2_prod_sum += p2
+            tail = memory[end:]
+
+if __name__ == "__main__":
+    p1_prod_sum, p2_prod_sum, _ = scan_file("3/input.txt")
+
+    print(f"Part 1: {p1_prod_sum}", f"Part 2: {p2_prod_sum}", sep="\n")
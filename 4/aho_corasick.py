@@ -0,0 +1,82 @@
+from collections import deque, defaultdict
+
+class Automaton:
+    def __init__(self, words):
+        self.words = list(words)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for i, word in enumerate(self.words):
+            state = 0
+            for letter in word:
+                if letter not in self.goto[state]:
+                    self.goto[state][letter] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = self.goto[state][letter]
+            self.output[state].append(i)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for letter, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and letter not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(letter, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def step(self, state, letter):
+        while state and letter not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(letter, 0)
+
+    def scan(self, letters):
+        state = 0
+        for i, letter in enumerate(letters):
+            state = self.step(state, letter)
+            for word in self.output[state]:
+                yield word, i
+
+class WordSearch:
+    def __init__(self, file):
+        with open(file) as f:
+            self.rows = [line.strip() for line in f if line.strip()]
+        self.height = len(self.rows)
+        self.width = len(self.rows[0])
+
+    # Every row, column and diagonal as (start cell, step), each read forwards and backwards
+    def lines(self):
+        starts = [((y, 0), (0, 1)) for y in range(self.height)]
+        starts += [((0, x), (1, 0)) for x in range(self.width)]
+        starts += [((y, 0), (1, 1)) for y in range(self.height)] + [((0, x), (1, 1)) for x in range(1, self.width)]
+        starts += [((y, self.width - 1), (1, -1)) for y in range(self.height)] + \
+            [((0, x), (1, -1)) for x in range(self.width - 1)]
+
+        for (y, x), (dy, dx) in starts:
+            cells = []
+            while 0 <= y < self.height and 0 <= x < self.width:
+                cells.append((y, x))
+                y += dy
+                x += dx
+
+            yield cells, (dy, dx)
+            yield cells[::-1], (-dy, -dx)
+
+    def search(self, words):
+        automaton = Automaton(words)
+        found = defaultdict(list)
+        for cells, direction in self.lines():
+            for word, end in automaton.scan(self.rows[y][x] for y, x in cells):
+                found[automaton.words[word]].append((cells[end - len(automaton.words[word]) + 1], direction))
+
+        return found
+
+if __name__ == "__main__":
+    word_search = WordSearch("4/input.txt")
+    found = word_search.search(["XMAS"])
+    for word, positions in found.items():
+        print(f"{word} found: {len(positions)}")
@@ -0,0 +1,53 @@
+import os
+import random
+import tempfile
+from time import perf_counter
+from parallel import count
+from vectorized import WordGrid
+
+SIZE = 4_000
+SAMPLES = 200
+
+def write_grid(rows, newline = "\n", final_newline = True):
+    f = tempfile.NamedTemporaryFile("wb", suffix = ".txt", delete = False)
+    with f:
+        f.write((newline.join(rows) + (newline if final_newline else "")).encode())
+    return f.name
+
+def generate(width, height):
+    return ["".join(random.choice("XMAS") for _ in range(width)) for _ in range(height)]
+
+def check(rows, newline = "\n", final_newline = True):
+    file = write_grid(rows, newline, final_newline)
+    try:
+        word_grid = WordGrid.load(file)
+        expected = (word_grid.count_xmas(), word_grid.count_x_mas())
+        assert count(file, 2) == expected, (rows, newline, final_newline, expected)
+    finally:
+        os.remove(file)
+
+if __name__ == "__main__":
+    # Every combination of line ending and final newline has to give the same rows as the vectorized load
+    check(["XMAS", "XMAS", "SAMX"], "\r\n", False)
+    for _ in range(SAMPLES):
+        check(generate(random.randint(1, 12), random.randint(1, 12)), random.choice(["\n", "\r\n"]), random.random() < 0.5)
+
+    file = write_grid(generate(SIZE, SIZE))
+    try:
+        start = perf_counter()
+        word_grid = WordGrid.load(file)
+        expected = (word_grid.count_xmas(), word_grid.count_x_mas())
+        vectorized_time = perf_counter() - start
+        del word_grid
+
+        print(f"{'processes':>10} {'time (s)':>12} {'speedup':>10}")
+        print(f"{'vectorized':>10} {vectorized_time:>12.3f} {1:>9.1f}x")
+        processes = 1
+        while processes <= os.cpu_count():
+            start = perf_counter()
+            assert count(file, processes) == expected
+            parallel_time = perf_counter() - start
+            print(f"{processes:>10} {parallel_time:>12.3f} {vectorized_time / parallel_time:>9.1f}x")
+            processes *= 2
+    finally:
+        os.remove(file)
@@ -0,0 +1,59 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from vectorized import WordGrid, DIRECTIONS
+
+BANDS_PER_PROCESS = 4
+HALO = WordGrid.PADDING
+
+_shared = None
+_grid = None
+
+def attach(name, shape, width):
+    global _grid, _shared
+    _shared = SharedMemory(name)
+    _grid = np.ndarray(shape, dtype = np.uint8, buffer = _shared.buf)[:, :width]
+
+# Each band owns the XMAS words starting in its rows and the X-MAS crosses centred
+# in them, the halo rows are only there so those can be read to the end
+def count_band(start, end):
+    top = max(0, start - HALO)
+    bottom = min(len(_grid), end + HALO)
+    band = WordGrid(_grid[top:bottom])
+    rows = slice(start - top, end - top)
+
+    xmas = sum(int(band.find_xmas(direction)[rows].sum()) for direction in DIRECTIONS)
+    x_mas = int(band.find_x_mas()[rows].sum())
+    return xmas, x_mas
+
+def count(file, processes = None):
+    processes = processes or os.cpu_count()
+    size = os.path.getsize(file)
+    with open(file, "rb") as f:
+        first_row = f.readline()
+
+    # Rows are read in place, so the block is rounded up to whole rows for a last row with
+    # no line ending, the bytes past the file are never part of a row's letters
+    stride = len(first_row) if first_row.endswith(b"\n") else size + 1
+    width = len(first_row.rstrip(b"\r\n"))
+    height = -(-size // stride)
+    shared = SharedMemory(create = True, size = max(1, height * stride))
+    try:
+        with open(file, "rb") as f:
+            f.readinto(shared.buf[:size])
+
+        band_size = max(1, -(-height // (processes * BANDS_PER_PROCESS)))
+        bands = [(start, min(height, start + band_size)) for start in range(0, height, band_size)]
+        with Pool(processes, initializer = attach, initargs = (shared.name, (height, stride), width)) as pool:
+            counts = pool.starmap(count_band, bands)
+    finally:
+        shared.close()
+        shared.unlink()
+
+    return sum(xmas for xmas, _ in counts), sum(x_mas for _, x_mas in counts)
+
+if __name__ == "__main__":
+    xmas, x_mas = count("4/input.txt")
+    print(f"XMAS found: {xmas}")
+    print(f"X-MAS found: {x_mas}")
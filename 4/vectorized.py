@@ -0,0 +1,78 @@
+import numpy as np
+
+WORD = b"XMAS"
+DIRECTIONS = [(-1, 0), (1, 0), (0, 1), (0, -1), (-1, 1), (-1, -1), (1, 1), (1, -1)]
+CORNERS = [(-1, -1), (1, 1), (-1, 1), (1, -1)]
+
+class WordGrid:
+    PADDING = len(WORD) - 1
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.height, self.width = self.grid.shape
+        self._padded = np.pad(self.grid, WordGrid.PADDING)
+
+    @staticmethod
+    def load(file):
+        data = np.fromfile(file, dtype = np.uint8)
+        data = data[data != ord("\r")]
+        if data[-1] != ord("\n"):
+            data = np.append(data, np.uint8(ord("\n")))
+
+        width = int(np.argmax(data == ord("\n")))
+        return WordGrid(data.reshape(-1, width + 1)[:, :width])
+
+    # The grid as seen from (row + dy * steps, col + dx * steps), zero outside the original grid
+    def shifted(self, dy, dx, steps = 1):
+        y = WordGrid.PADDING + dy * steps
+        x = WordGrid.PADDING + dx * steps
+        return self._padded[y:y + self.height, x:x + self.width]
+
+    def find_xmas(self, direction):
+        dy, dx = direction
+        found = np.ones(self.grid.shape, dtype = bool)
+        for steps, letter in enumerate(WORD):
+            found &= self.shifted(dy, dx, steps) == letter
+
+        return found
+
+    def find_x_mas(self):
+        nw, se, ne, sw = [self.shifted(dy, dx) for dy, dx in CORNERS]
+        m, s = ord("M"), ord("S")
+        return (self.grid == ord("A")) & \
+            (((nw == m) & (se == s)) | ((nw == s) & (se == m))) & \
+            (((ne == m) & (sw == s)) | ((ne == s) & (sw == m)))
+
+    def count_xmas(self):
+        return sum(int(self.find_xmas(direction).sum()) for direction in DIRECTIONS)
+
+    def count_x_mas(self):
+        return int(self.find_x_mas().sum())
+
+    # The overlays are only built when asked for, counting never touches them
+    def render(self, used):
+        return "\n".join(bytes(row).decode() for row in np.where(used, self.grid, ord(".")).astype(np.uint8))
+
+    def render_xmas(self):
+        used = np.zeros(self.grid.shape, dtype = bool)
+        for dy, dx in DIRECTIONS:
+            found = np.pad(self.find_xmas((dy, dx)), WordGrid.PADDING)
+            for steps in range(len(WORD)):
+                y = WordGrid.PADDING - dy * steps
+                x = WordGrid.PADDING - dx * steps
+                used |= found[y:y + self.height, x:x + self.width]
+
+        return self.render(used)
+
+    def render_x_mas(self):
+        found = np.pad(self.find_x_mas(), 1)
+        used = found[1:-1, 1:-1].copy()
+        for dy, dx in CORNERS:
+            used |= found[1 - dy:1 - dy + self.height, 1 - dx:1 - dx + self.width]
+
+        return self.render(used)
+
+if __name__ == "__main__":
+    word_grid = WordGrid.load("4/input.txt")
+    print(f"XMAS found: {word_grid.count_xmas()}")
+    print(f"X-MAS found: {word_grid.count_x_mas()}")
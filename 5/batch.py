@@ -0,0 +1,67 @@
+import numpy as np
+
+CHUNK_SIZE = 65536
+
+class PrecedenceMatrix:
+    def __init__(self, rules):
+        rules = np.asarray(rules, dtype = np.int64).reshape(-1, 2)
+        self.pages = np.unique(rules)
+        self.padding = len(self.pages)
+
+        # One extra row and column for padding and pages no rule mentions
+        self.matrix = np.zeros((self.padding + 1, self.padding + 1), dtype = bool)
+        ids = self.page_ids(rules)
+        self.matrix[ids[:, 0], ids[:, 1]] = True
+
+    def page_ids(self, pages):
+        if not self.padding:
+            return np.full(np.shape(pages), self.padding)
+
+        ids = np.minimum(np.searchsorted(self.pages, pages), self.padding)
+        known = self.pages[np.minimum(ids, self.padding - 1)] == pages
+        return np.where(known, ids, self.padding)
+
+    def encode(self, updates):
+        lengths = np.array([len(pages) for pages in updates], dtype = np.int64)
+        in_update = np.arange(lengths.max()) < lengths[:, None]
+        pages = np.zeros(in_update.shape, dtype = np.int64)
+        pages[in_update] = np.concatenate(updates)
+        ids = np.where(in_update, self.page_ids(pages), self.padding)
+
+        return pages, ids, lengths
+
+    # Returns whether each update is correct, its middle page, and the middle page once sorted
+    def validate(self, updates):
+        if not len(updates):
+            return np.zeros(0, dtype = bool), np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.int64)
+
+        results = [self.validate_chunk(updates[i:i + CHUNK_SIZE]) for i in range(0, len(updates), CHUNK_SIZE)]
+        return tuple(np.concatenate(result) for result in zip(*results))
+
+    def validate_chunk(self, updates):
+        pages, ids, lengths = self.encode(updates)
+        rows = np.arange(len(updates))
+
+        earlier, later = np.triu_indices(ids.shape[1], 1)
+        correct = ~self.matrix[ids[:, later], ids[:, earlier]].any(axis = 1)
+
+        # In the sorted update the middle page is the one with exactly half of the others ruled before it
+        ruled_before = self.matrix[ids[:, :, None], ids[:, None, :]].sum(axis = 1)
+        sorted_middle = np.argmax(ruled_before == (lengths // 2)[:, None], axis = 1)
+
+        return correct, pages[rows, lengths // 2], pages[rows, sorted_middle]
+
+def load(file):
+    with open(file) as f:
+        lines = f.read().splitlines()
+
+    i = lines.index("")
+    rules = [[int(page) for page in rule.split("|")] for rule in lines[:i]]
+    updates = [np.array(page_list.split(","), dtype = np.int64) for page_list in lines[i+1:] if page_list]
+    return PrecedenceMatrix(rules), updates
+
+if __name__ == "__main__":
+    matrix, updates = load("5/input.txt")
+    correct, middles, sorted_middles = matrix.validate(updates)
+
+    print(f"Part 1: {middles[correct].sum()}\nPart 2: {sorted_middles[~correct].sum()}")
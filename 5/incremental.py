@@ -0,0 +1,95 @@
+from collections import defaultdict
+from functools import cmp_to_key
+from itertools import combinations
+from main import get_middle
+
+class PrintQueue:
+    def __init__(self, rules = (), updates = ()):
+        self.rules = set()
+        self.pages_after = defaultdict(set)
+        self.updates = []
+        self.middles = []
+        self.updates_with_pair = defaultdict(set)
+        self.p1_sum = 0
+        self.p2_sum = 0
+
+        for page, before in rules:
+            self.rules.add((page, before))
+            self.pages_after[page].add(before)
+
+        for pages in updates:
+            self.add_update(pages)
+
+    def is_correct(self, pages):
+        positions = {page: i for i, page in enumerate(pages)}
+        for i, page in enumerate(pages):
+            for before in self.pages_after[page]:
+                if positions.get(before, i) < i:
+                    return False
+        return True
+
+    def compare(self, page, other):
+        if (page, other) in self.rules:
+            return -1
+        elif (other, page) in self.rules:
+            return 1
+        return 0
+
+    def revalidate(self, i):
+        correct, middle = self.middles[i]
+        if correct:
+            self.p1_sum -= middle
+        else:
+            self.p2_sum -= middle
+
+        pages = self.updates[i]
+        correct = self.is_correct(pages)
+        if correct:
+            middle = get_middle(pages)
+            self.p1_sum += middle
+        else:
+            middle = get_middle(sorted(pages, key = cmp_to_key(self.compare)))
+            self.p2_sum += middle
+
+        self.middles[i] = correct, middle
+
+    def add_update(self, pages):
+        i = len(self.updates)
+        self.updates.append(pages)
+        self.middles.append((True, 0))
+        for pair in combinations(pages, 2):
+            self.updates_with_pair[frozenset(pair)].add(i)
+
+        self.revalidate(i)
+
+    # Only updates containing both pages of a rule can be affected by it
+    def add_rule(self, page, before):
+        if (page, before) in self.rules:
+            return
+
+        self.rules.add((page, before))
+        self.pages_after[page].add(before)
+        for i in self.updates_with_pair.get(frozenset((page, before)), ()):
+            self.revalidate(i)
+
+    def remove_rule(self, page, before):
+        if (page, before) not in self.rules:
+            return
+
+        self.rules.remove((page, before))
+        self.pages_after[page].remove(before)
+        for i in self.updates_with_pair.get(frozenset((page, before)), ()):
+            self.revalidate(i)
+
+if __name__ == "__main__":
+    with open("5/input.txt") as f:
+        lines = f.readlines()
+
+    i = lines.index("\n")
+    rules, page_lists = lines[:i], lines[i+1:]
+
+    queue = PrintQueue(updates = [page_list.strip().split(",") for page_list in page_lists])
+    for rule in rules:
+        queue.add_rule(*rule.strip().split("|"))
+
+    print(f"Part 1: {queue.p1_sum}\nPart 2: {queue.p2_sum}")
@@ -1,61 +1,69 @@
+from collections import defaultdict
+from functools import cmp_to_key
+
 class PageRule:
-    _page_rules = []
+    _page_rules = set()
+    _pages_after = defaultdict(set)
 
     def __init__(self, page, before):
         self.page = page
         self.before = before
-        PageRule._page_rules.append(self)
+        PageRule._page_rules.add((page, before))
+        PageRule._pages_after[page].add(before)
 
     @staticmethod
     def get_rules(page):
-        rules = []
-        for rule in PageRule._page_rules:
-            if rule.page == page:
-                rules.append(rule)
-
-        return rules
+        return PageRule._pages_after[page]
 
     @staticmethod
-    def is_correct(pages):
+    def is_correct(pages, verbose = False):
+        positions = {page: i for i, page in enumerate(pages)}
         for i, page in enumerate(pages):
-            rules = PageRule.get_rules(page)
-            for rule in rules:
-                if rule.before in pages[:i]:
-                    print(f"{pages} breaks rule {page}|{rule.before}")
-                    return False, page, rule.before
-        
-        print(f"{pages} is correct")
+            for before in PageRule.get_rules(page):
+                if positions.get(before, i) < i:
+                    if verbose:
+                        print(f"{pages} breaks rule {page}|{before}")
+                    return False, page, before
+
+        if verbose:
+            print(f"{pages} is correct")
         return True, None, None
-    
+
     @staticmethod
-    def sort(pages, page, before):
-        correct = False
-        while not correct:
-            pages.remove(page)
-            pages.insert(pages.index(before), page)
-            correct, page, before = PageRule.is_correct(pages)
+    def compare(page, other):
+        if (page, other) in PageRule._page_rules:
+            return -1
+        elif (other, page) in PageRule._page_rules:
+            return 1
+        return 0
 
+    @staticmethod
+    def sort(pages, verbose = False):
+        pages = sorted(pages, key = cmp_to_key(PageRule.compare))
+        if verbose:
+            print(f"{pages} after sorting")
         return pages
-    
+
 def get_middle(pages):
     return int(pages[len(pages)//2])
 
-with open("5/input.txt") as f:
-    lines = f.readlines()
+if __name__ == "__main__":
+    with open("5/input.txt") as f:
+        lines = f.readlines()
 
-i = lines.index("\n")
-rules, page_lists = lines[:i], lines[i+1:]
+    i = lines.index("\n")
+    rules, page_lists = lines[:i], lines[i+1:]
 
-for rule in rules:
-    PageRule(*rule.strip().split("|"))
+    for rule in rules:
+        PageRule(*rule.strip().split("|"))
 
-p1_sum = p2_sum = 0
-for page_list in page_lists:
-    pages = page_list.strip().split(",")
-    correct, page, before = PageRule.is_correct(pages)
-    if correct:
-        p1_sum += get_middle(pages)
-    else:
-        p2_sum += get_middle(PageRule.sort(pages, page, before))
+    p1_sum = p2_sum = 0
+    for page_list in page_lists:
+        pages = page_list.strip().split(",")
+        correct, _, _ = PageRule.is_correct(pages)
+        if correct:
+            p1_sum += get_middle(pages)
+        else:
+            p2_sum += get_middle(PageRule.sort(pages))
 
-print(f"Part 1: {p1_sum}\nPart 2: {p2_sum}")
\ No newline at end of file
+    print(f"Part 1: {p1_sum}\nPart 2: {p2_sum}")
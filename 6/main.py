@@ -1,6 +1,6 @@
 from enum import Enum
 from copy import deepcopy
-from time import sleep
+from threading import Event, Thread
 
 class Facing(Enum):
     NORTH = "^"
@@ -34,6 +34,7 @@ class Facing(Enum):
 class Map:
     def __init__(self, file_name):
         self.load_map(file_name)
+        self.trail = []
         self.width = len(self[0])
         self.height = len(self)
     
@@ -56,31 +57,24 @@ class Map:
     def is_obstacle(self, x, y):
         return self[x][y].type in (Position.Type.OBSTACLE, Position.Type.TEST_OBSTACLE)
     
-    def run(self, verbose = False):
+    def run(self):
         init_guard_position = self.guard_position
         visited = set()
 
-        if verbose:
-            print(self, end = "")
-
         while True:
             x, y, facing = self.guard_position
-            self.guard_position = init_guard_position
             self[x][y].visited.add(facing)
+            self.trail.append(self[x][y])
             visited.add(self[x][y])
 
             ahead_x, ahead_y = facing.coord_ahead(x, y)
 
             if not self.is_valid_position(ahead_x, ahead_y):
-                if verbose:
-                    print()
-
+                self.guard_position = init_guard_position
                 return False, visited
             
             if self[ahead_x][ahead_y].was_visited(facing):
-                if verbose:
-                    print()
-
+                self.guard_position = init_guard_position
                 return True, visited
 
             if self.is_obstacle(ahead_x, ahead_y):
@@ -89,28 +83,17 @@ class Map:
                 x = ahead_x
                 y = ahead_y
 
-            if verbose:
-                move_caret_up(self.height)
-                print(self, end = "")
-                sleep(0.005)
-
             self.guard_position = (x, y, facing)
 
     def count_visited(self):
         return sum([1 for row in self for pos in row if pos.was_visited()])
     
-    def __str__(self):
-        string = ""
+    def symbol(self, x, y):
         guard_x, guard_y, guard_facing = self.guard_position
-        for x in range(self.height):
-            for y in range(self.width):
-                if (x, y) == (guard_x, guard_y):
-                    string += str(guard_facing)
-                else:
-                    string += str(self[x][y])
-            string += "\n"
+        return str(guard_facing) if (x, y) == (guard_x, guard_y) else str(self[x][y])
 
-        return string
+    def __str__(self):
+        return "".join("".join(self.symbol(x, y) for y in range(self.width)) + "\n" for x in range(self.height))
 
     def __getitem__(self, key):
         return self._map[key]
@@ -151,12 +134,63 @@ class Position:
         else:
             return self.type.value
         
+class Renderer:
+    SAVE_CARET = "\0337"
+    RESTORE_CARET = "\0338"
+
+    def __init__(self, map, fps = 30):
+        self.map = map
+        self.interval = 1 / fps
+        self.painted = 0
+        self.guard = None
+        self._stopped = Event()
+        self._thread = Thread(target = self.animate, daemon = True)
+
+    # Samples the map on its own thread at a fixed rate, the simulation never waits on it
+    def animate(self):
+        while not self._stopped.wait(self.interval):
+            self.repaint()
+
+    # Only the cells the guard has stood on since the last frame and where it was can have
+    # changed, so a frame costs the steps taken since then instead of a scan of the map
+    def repaint(self):
+        painted = len(self.map.trail)
+        cells = {(pos.x, pos.y) for pos in self.map.trail[self.painted:painted]}
+        cells.add(self.guard)
+        self.guard = self.map.guard_position[:2]
+        cells.add(self.guard)
+        self.painted = painted
+
+        changes = "".join(Renderer.RESTORE_CARET + move_caret(x, y) + self.map.symbol(x, y) for x, y in cells)
+        print(changes, end = "", flush = True)
+
+    def __enter__(self):
+        print(self.map, end = "")
+        self.painted = len(self.map.trail)
+        self.guard = self.map.guard_position[:2]
+        move_caret_up(self.map.height)
+        print(Renderer.SAVE_CARET, end = "", flush = True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._stopped.set()
+        self._thread.join()
+        self.repaint()
+        print(Renderer.RESTORE_CARET + "\n" * self.map.height)
+
 def move_caret_up(lines = 1):
     print("\033[F" * lines, end = "")
 
+def move_caret(down, right):
+    return (f"\033[{down}B" if down else "") + (f"\033[{right}C" if right else "")
+
+SHOW_LOOP_SPOTS = False
+
 map = Map("6/input.txt")
 map_copy = deepcopy(map)
-_, visited = map_copy.run(True)
+with Renderer(map_copy):
+    _, visited = map_copy.run()
 print("=" * map.width)
 print()
 
@@ -172,13 +206,12 @@ for pos in visited:
 
     if map_copy.run()[0]:
         loop_spots += 1
-        print(" " * 50, end = "\r")
-        print(map_copy)
-        print("-" * map.width)
-        print()
+        if SHOW_LOOP_SPOTS:
+            print(" " * 50, end = "\r")
+            print(map_copy)
+            print("-" * map.width)
+            print()
 
     print(f"Checked: {checked}/{len(visited)}", f"Loop spots: {loop_spots}", end = "\r")
 
-print(f"Part 1: {len(visited)}, part 2: {loop_spots}", " " * 50)
-
-
+print(f"Part 1: {len(visited)}, part 2: {loop_spots}", " " * 50)
\ No newline at end of file
@@ -0,0 +1,54 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from time import monotonic
+from walker import Walker
+
+CHUNK_SIZE = 256
+PROGRESS_INTERVAL = 0.5
+
+_shared = None
+_walker = None
+
+# Workers see the jump tables and obstacles published by the parent, nothing is rebuilt
+def attach(name, width, start, cells):
+    global _shared, _walker
+    _shared = SharedMemory(name)
+    jumps = [_shared.buf[facing * cells * 8:(facing + 1) * cells * 8].cast("q") for facing in range(4)]
+    obstacles = _shared.buf[4 * cells * 8:4 * cells * 8 + cells]
+    _walker = Walker(obstacles, width, start, jumps)
+
+def count_loop_spots(cells):
+    return len(cells), len(_walker.find_loop_spots(cells))
+
+def find_loop_spots(walker, candidates, processes = None, verbose = False):
+    cells = len(walker.obstacles)
+    shared = SharedMemory(create = True, size = 4 * cells * 8 + cells)
+    try:
+        for facing, jumps in enumerate(walker.jumps):
+            shared.buf[facing * cells * 8:(facing + 1) * cells * 8] = jumps.tobytes()
+        shared.buf[4 * cells * 8:] = walker.obstacles
+
+        chunks = [candidates[i:i + CHUNK_SIZE] for i in range(0, len(candidates), CHUNK_SIZE)]
+        checked = loop_spots = 0
+        last_report = monotonic()
+        with Pool(processes or os.cpu_count(), initializer = attach,
+                  initargs = (shared.name, walker.width, walker.start, cells)) as pool:
+            for chunk_checked, chunk_loop_spots in pool.imap_unordered(count_loop_spots, chunks):
+                checked += chunk_checked
+                loop_spots += chunk_loop_spots
+
+                if verbose and monotonic() - last_report >= PROGRESS_INTERVAL:
+                    print(f"Checked: {checked}/{len(candidates)}", f"Loop spots: {loop_spots}", end = "\r")
+                    last_report = monotonic()
+    finally:
+        shared.close()
+        shared.unlink()
+
+    return loop_spots
+
+if __name__ == "__main__":
+    walker = Walker.load("6/input.txt")
+    visited = walker.visited()
+    loop_spots = find_loop_spots(walker, visited, verbose = True)
+    print(f"Part 1: {len(visited)}, part 2: {loop_spots}", " " * 50)
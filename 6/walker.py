@@ -0,0 +1,149 @@
+from array import array
+
+NORTH, EAST, SOUTH, WEST = range(4)
+FACINGS = "^>v<"
+OBSTACLE = "#"
+EXIT = -1
+
+class Walker:
+    def __init__(self, obstacles, width, start, jumps = None):
+        self.obstacles = obstacles
+        self.width = width
+        self.height = len(obstacles) // width
+        self.start = start
+        self.steps = [-self.width, 1, self.width, -1]
+        self.turns = bytearray(len(obstacles))
+        self.jumps = jumps or self.build_jumps()
+
+    @staticmethod
+    def load(file_name):
+        with open(file_name) as f:
+            rows = [line.strip() for line in f if line.strip()]
+
+        width = len(rows[0])
+        obstacles = bytearray(len(rows) * width)
+        for x, row in enumerate(rows):
+            for y, char in enumerate(row):
+                cell = x * width + y
+                if char == OBSTACLE:
+                    obstacles[cell] = 1
+                elif char in FACINGS:
+                    start = (cell, FACINGS.index(char))
+
+        return Walker(obstacles, width, start)
+
+    # jumps[facing][cell] is where the guard stops in front of the next obstacle, or EXIT
+    def build_jumps(self):
+        jumps = [array("q", [EXIT]) * len(self.obstacles) for _ in FACINGS]
+        columns = [range(y, len(self.obstacles), self.width) for y in range(self.width)]
+        rows = [range(x * self.width, (x + 1) * self.width) for x in range(self.height)]
+        paths = {NORTH: [column[::-1] for column in columns], EAST: rows,
+                 SOUTH: columns, WEST: [row[::-1] for row in rows]}
+
+        for facing, lines in paths.items():
+            for line in lines:
+                stop = EXIT
+                for cell in reversed(line):
+                    if self.obstacles[cell]:
+                        stop = cell - self.steps[facing]
+                    else:
+                        jumps[facing][cell] = stop
+
+        return jumps
+
+    def next_stop(self, cell, facing, obstacle = None):
+        stop = self.jumps[facing][cell]
+        if obstacle is None:
+            return stop
+
+        x, y = divmod(cell, self.width)
+        obstacle_x, obstacle_y = divmod(obstacle, self.width)
+        if facing in (NORTH, SOUTH) and obstacle_y == y:
+            distance = (obstacle_x - x) * (1 if facing == SOUTH else -1)
+        elif facing in (EAST, WEST) and obstacle_x == x:
+            distance = (obstacle_y - y) * (1 if facing == EAST else -1)
+        else:
+            return stop
+
+        if distance > 0 and (stop == EXIT or distance * abs(self.steps[facing]) <= abs(stop - cell)):
+            return cell + (distance - 1) * self.steps[facing]
+        return stop
+
+    def is_valid_step(self, cell, facing):
+        x, y = divmod(cell, self.width)
+        return (facing == NORTH and x > 0) or (facing == SOUTH and x < self.height - 1) or \
+            (facing == WEST and y > 0) or (facing == EAST and y < self.width - 1)
+
+    # Every (cell, facing) the guard is in, one step or turn at a time, until it leaves or loops
+    def patrol(self):
+        cell, facing = self.start
+        seen = bytearray(len(self.obstacles))
+        while not seen[cell] & 1 << facing:
+            seen[cell] |= 1 << facing
+            yield cell, facing
+            if not self.is_valid_step(cell, facing):
+                return
+
+            ahead = cell + self.steps[facing]
+            if self.obstacles[ahead]:
+                facing = (facing + 1) % 4
+            else:
+                cell = ahead
+
+    # Jumps from turn to turn, a loop is a turn taken twice in the same place and facing.
+    # Turns already taken before (cell, facing) can be passed in as a mask of their own
+    def loops(self, obstacle = None, cell = None, facing = None, taken = None):
+        if cell is None:
+            cell, facing = self.start
+
+        turned = []
+        loop = False
+        while True:
+            stop = self.next_stop(cell, facing, obstacle)
+            if stop == EXIT:
+                break
+
+            if (self.turns[stop] | (taken[stop] if taken else 0)) & 1 << facing:
+                loop = True
+                break
+
+            if not self.turns[stop]:
+                turned.append(stop)
+            self.turns[stop] |= 1 << facing
+            cell, facing = stop, (facing + 1) % 4
+
+        for stop in turned:
+            self.turns[stop] = 0
+
+        return loop
+
+    def visited(self):
+        return list(dict.fromkeys(cell for cell, _ in self.patrol()))
+
+    def find_loop_spots(self, cells):
+        return [cell for cell in cells if cell != self.start[0] and self.loops(cell)]
+
+    # Each candidate is only tested from the step before the guard first walks into it,
+    # the patrol up to there is identical and its turns are carried along as a mask
+    def find_loop_spots_on_patrol(self):
+        loop_spots = []
+        taken = bytearray(len(self.obstacles))
+        tried = {self.start[0]}
+        for cell, facing in self.patrol():
+            if not self.is_valid_step(cell, facing):
+                break
+
+            ahead = cell + self.steps[facing]
+            if self.obstacles[ahead]:
+                taken[cell] |= 1 << facing
+            elif ahead not in tried:
+                tried.add(ahead)
+                if self.loops(ahead, cell, facing, taken):
+                    loop_spots.append(ahead)
+
+        return loop_spots
+
+if __name__ == "__main__":
+    walker = Walker.load("6/input.txt")
+    visited = walker.visited()
+    print(f"Part 1: {len(visited)}, part 2: {len(walker.find_loop_spots_on_patrol())}")
@@ -1,39 +1,77 @@
-from itertools import product
-
-P1_OPERATORS = [
-    lambda x, y: x + y,
-    lambda x, y: x * y
-]
-
-P2_OPERATORS = [
-    lambda x, y: int(str(x) + str(y))
-]
-
-def test_possibilities(possibilities, operands, test):
-    for possibility in possibilities:
-        result = operands[0]
-        for i in range(len(possibility)):
-            result = possibility[i](result, operands[i + 1])
-        if result == test:
-            return test
-            
-    return 0
-
-with open("7/input.txt") as f:
-    p1_calibration_sum = 0
-    p2_calibration_sum = 0
-    for line in f:
-        test, operands = line.strip().split(":")
-        test = int(test)
-        operands = list(map(lambda operand: int(operand), operands.strip().split(" ")))
-
-        p1_possiblities = product(P1_OPERATORS, repeat = len(operands) - 1)
-        p1_calibration_sum += test_possibilities(p1_possiblities, operands, test)
-
-        p2_possiblities = product(P1_OPERATORS + P2_OPERATORS, repeat = len(operands) - 1)
-        p2_calibration_sum += test_possibilities(p2_possiblities, operands, test)
-
-    print(f"Part 1: {p1_calibration_sum}\nPart 2: {p2_calibration_sum}")
-                
-
-    
+class Operator:
+    registry = {}
+    ANY = object()
+
+    # invert(result, operand) gives the value the operator was applied to,
+    # None if no value could work or ANY if every value would
+    def __init__(self, symbol, invert):
+        self.symbol = symbol
+        self.invert = invert
+        Operator.registry[symbol] = self
+
+def multiply_inverse(result, operand):
+    if operand == 0:
+        return Operator.ANY if result == 0 else None
+    return result // operand if result % operand == 0 else None
+
+def concat_inverse(result, operand):
+    shift = 10 ** len(str(operand))
+    if result < operand or (result - operand) % shift:
+        return None
+    return (result - operand) // shift
+
+Operator("+", lambda result, y: result - y if result >= y else None)
+Operator("*", multiply_inverse)
+Operator("||", concat_inverse)
+
+P1_OPERATORS = [Operator.registry[symbol] for symbol in ("+", "*")]
+P2_OPERATORS = P1_OPERATORS + [Operator.registry["||"]]
+
+# Works back from the test value so every branch an operator can't invert is dropped straight away.
+# One search answers both parts, trying the Part 1 operators first: a solution that only uses
+# them answers Part 1 too, otherwise it keeps looking for one after finding a Part 2 solution
+def solvable_parts(test, operands):
+    p2_solvable = False
+    stack = [(test, len(operands) - 1, False)]
+    while stack:
+        result, i, extended = stack.pop()
+        if i == 0:
+            if result == operands[0]:
+                if not extended:
+                    return True, True
+                p2_solvable = True
+            continue
+
+        if extended and p2_solvable:
+            continue
+
+        for operator in reversed(P2_OPERATORS):
+            previous = operator.invert(result, operands[i])
+            uses_extra = extended or operator not in P1_OPERATORS
+            if previous is Operator.ANY:
+                if not uses_extra:
+                    return True, True
+                p2_solvable = True
+            elif previous is not None:
+                stack.append((previous, i - 1, uses_extra))
+
+    return False, p2_solvable
+
+def parse_equation(line):
+    test, operands = line.strip().split(":")
+    return int(test), [int(operand) for operand in operands.split()]
+
+if __name__ == "__main__":
+    with open("7/input.txt") as f:
+        p1_calibration_sum = 0
+        p2_calibration_sum = 0
+        for line in f:
+            test, operands = parse_equation(line)
+            p1_solvable, p2_solvable = solvable_parts(test, operands)
+
+            if p1_solvable:
+                p1_calibration_sum += test
+            if p2_solvable:
+                p2_calibration_sum += test
+
+        print(f"Part 1: {p1_calibration_sum}\nPart 2: {p2_calibration_sum}")
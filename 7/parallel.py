@@ -0,0 +1,50 @@
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from main import parse_equation, solvable_parts
+
+CHUNK_LINES = 10000
+PENDING_PER_PROCESS = 2
+
+def solve_chunk(lines):
+    p1_calibration_sum = 0
+    p2_calibration_sum = 0
+    for line in lines:
+        test, operands = parse_equation(line)
+        p1_solvable, p2_solvable = solvable_parts(test, operands)
+
+        if p1_solvable:
+            p1_calibration_sum += test
+        if p2_solvable:
+            p2_calibration_sum += test
+
+    return p1_calibration_sum, p2_calibration_sum
+
+# Only a few chunks per process are in flight at once, so the file is never read ahead of the workers
+def solve_file(file, processes = None):
+    processes = processes or os.cpu_count()
+    p1_calibration_sum = 0
+    p2_calibration_sum = 0
+    with open(file) as f, Pool(processes) as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(f, CHUNK_LINES))
+            lines = [line for line in chunk if line.strip()]
+            if lines:
+                pending.append(pool.apply_async(solve_chunk, (lines,)))
+
+            # A chunk of blank lines is not the end of the file, only an empty read is
+            if pending and (not chunk or len(pending) >= processes * PENDING_PER_PROCESS):
+                p1, p2 = pending.popleft().get()
+                p1_calibration_sum += p1
+                p2_calibration_sum += p2
+            elif not chunk:
+                break
+
+    return p1_calibration_sum, p2_calibration_sum
+
+if __name__ == "__main__":
+    p1_calibration_sum, p2_calibration_sum = solve_file("7/input.txt")
+
+    print(f"Part 1: {p1_calibration_sum}\nPart 2: {p2_calibration_sum}")
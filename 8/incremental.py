@@ -0,0 +1,56 @@
+from collections import Counter, defaultdict
+from sparse import SparseMap
+
+# Antinodes are reference counted by the antenna pairs producing them, so adding or removing
+# an antenna only touches the pairs it forms within its own frequency
+class IncrementalMap(SparseMap):
+    def __init__(self, width, height, antennae = None):
+        super().__init__(width, height, defaultdict(list))
+        self.antinodes = Counter()
+        self.resonant_antinodes = Counter()
+
+        for freq, positions in (antennae or {}).items():
+            for pos in positions:
+                self.add_antenna(freq, pos)
+
+    @staticmethod
+    def load(file):
+        map = SparseMap.load(file)
+        return IncrementalMap(map.width, map.height, map.antennae)
+
+    def mark(self, antinodes, x, y, change = 1):
+        antinode = y * self.width + x
+        antinodes[antinode] += change
+        if not antinodes[antinode]:
+            del antinodes[antinode]
+
+    def update_pair(self, pos1, pos2, change):
+        for x, y in self.pair_antinodes(pos1, pos2):
+            self.mark(self.antinodes, x, y, change)
+
+        for x, y in self.pair_resonant_antinodes(pos1, pos2):
+            self.mark(self.resonant_antinodes, x, y, change)
+
+    # The counts are always up to date, so a run only rebuilds them from the antennae
+    def run(self):
+        self.antinodes.clear()
+        self.resonant_antinodes.clear()
+        super().run()
+
+    def add_antenna(self, freq, pos):
+        if pos in self.antennae[freq]:
+            raise ValueError(f"there is already a {freq} antenna at {pos}")
+
+        for other in self.antennae[freq]:
+            self.update_pair(other, pos, 1)
+        self.antennae[freq].append(pos)
+
+    def remove_antenna(self, freq, pos):
+        self.antennae[freq].remove(pos)
+        for other in self.antennae[freq]:
+            self.update_pair(other, pos, -1)
+
+if __name__ == "__main__":
+    map = IncrementalMap.load("8/input.txt")
+    print(map.count_antinodes())
+    print(map.count_antinodes(True))
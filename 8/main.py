@@ -1,105 +1,92 @@
 import math
-from time import sleep
-
-class Node:
-    def __init__(self, pos):
-        self.pos = pos
-        self.antinode = False
-
-    def __str__(self):
-        return Map.ANTINODE_SYMBOL if self.antinode else Map.NODE_SMYBOL
-
-class Antenna(Node):
-    def __init__(self, pos, freq):
-        self.freq = freq
-        super().__init__(pos)
-
-    def __str__(self):
-        return self.freq
+from collections import defaultdict
+from itertools import combinations
 
 class Map:
     NODE_SMYBOL = "."
     ANTINODE_SYMBOL = "#"
     
     def __init__(self, file):
-        self.nodes = []
         with open(file) as f:
-            for y, line in enumerate(f):
-                self.nodes.append([])
-                for x, symbol in enumerate(line.strip()):
-                    if symbol == Map.NODE_SMYBOL:
-                        self.nodes[y].append(Node((x, y)))
-                    else:
-                        self.nodes[y].append(Antenna((x, y), symbol))
-
-        self.width = len(self.nodes[0])
-        self.height = len(self.nodes)
-
-    def get_node(self, pos):
-        x, y = pos
-        return self.nodes[y][x]
-    
-    def get_all_freq(self, freq):
-        return [node for node in self.get_all_antennae() if node.freq == freq]
-    
-    def get_all_antennae(self):
-        return [node for row in self.nodes for node in row if isinstance(node, Antenna)]
+            self.rows = [line.strip() for line in f if line.strip()]
+
+        self.width = len(self.rows[0])
+        self.height = len(self.rows)
+
+        self.antennae = defaultdict(list)
+        for y, row in enumerate(self.rows):
+            for x, symbol in enumerate(row):
+                if symbol != Map.NODE_SMYBOL:
+                    self.antennae[symbol].append((x, y))
+
+        self.antinodes = bytearray(self.width * self.height)
+        self.resonant_antinodes = bytearray(self.width * self.height)
     
     def is_on_map(self, pos):
         x, y = pos
         return 0 <= x < self.width and 0 <= y < self.height
     
-    def set_antinodes(self, node1, node2, resonate = False):
-        if resonate:
-            node1.antinode = True
-            node2.antinode = True
-            
-        x1, y1 = node1.pos
-        x2, y2 = node2.pos
+    def mark(self, antinodes, x, y):
+        antinodes[y * self.width + x] = 1
+
+    def pair_antinodes(self, pos1, pos2):
+        x1, y1 = pos1
+        x2, y2 = pos2
 
         dx = x2 - x1
         dy = y2 - y1
 
-        def add_antinode(x, y, dx, dy):
-            while self.is_on_map((x, y)):
-                x = x + dx
-                y = y + dy
+        for x, y in ((x1 - dx, y1 - dy), (x2 + dx, y2 + dy)):
+            if self.is_on_map((x, y)):
+                yield x, y
+
+    # Every grid point on the line is a whole number of reduced steps away from either antenna
+    def pair_resonant_antinodes(self, pos1, pos2):
+        x1, y1 = pos1
+        x2, y2 = pos2
 
-                if self.is_on_map((x, y)):
-                    self.get_node((x, y)).antinode = True
+        dx = x2 - x1
+        dy = y2 - y1
 
-                if not resonate:
-                    break
+        step = math.gcd(dx, dy)
+        dx //= step
+        dy //= step
 
-        add_antinode(x1, y1, -dx, -dy)
-        add_antinode(x2, y2, dx, dy)
+        for x, y, dx, dy in ((x1, y1, dx, dy), (x1 - dx, y1 - dy, -dx, -dy)):
+            while self.is_on_map((x, y)):
+                yield x, y
+                x += dx
+                y += dy
 
-    def count_antinodes(self):
-        return sum([1 for row in self.nodes for node in row if node.antinode])
-    
-    def run(self, resonate = False):
-        checked = []
+    def set_antinodes(self, pos1, pos2):
+        for x, y in self.pair_antinodes(pos1, pos2):
+            self.mark(self.antinodes, x, y)
 
-        for node in self.get_all_antennae():
-            others = self.get_all_freq(node.freq)
-            others.remove(node)
+        for x, y in self.pair_resonant_antinodes(pos1, pos2):
+            self.mark(self.resonant_antinodes, x, y)
 
-            while others:
-                other = others.pop()
-                if other in checked:
-                    continue
-                self.set_antinodes(node, other, resonate)
+    def count_antinodes(self, resonate = False):
+        return (self.resonant_antinodes if resonate else self.antinodes).count(1)
+    
+    def run(self):
+        for positions in self.antennae.values():
+            for pos1, pos2 in combinations(positions, 2):
+                self.set_antinodes(pos1, pos2)
 
-            checked.append(node)
+    def render(self, resonate = False):
+        antinodes = self.resonant_antinodes if resonate else self.antinodes
+        return "\n".join("".join(
+            Map.ANTINODE_SYMBOL if symbol == Map.NODE_SMYBOL and antinodes[y * self.width + x] else symbol
+            for x, symbol in enumerate(row)) for y, row in enumerate(self.rows))
 
     def __str__(self):
-        return "\n".join(["".join([str(node) for node in row]) for row in self.nodes])
+        return self.render()
     
-map = Map("8/input.txt")
-map.run()
-print(map)
-print(map.count_antinodes())
-print("=" * (map.width + 2))
-map.run(True)
-print(map)
-print(map.count_antinodes())
\ No newline at end of file
+if __name__ == "__main__":
+    map = Map("8/input.txt")
+    map.run()
+    print(map)
+    print(map.count_antinodes())
+    print("=" * (map.width + 2))
+    print(map.render(True))
+    print(map.count_antinodes(True))
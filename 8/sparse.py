@@ -0,0 +1,55 @@
+import re
+from collections import defaultdict
+from main import Map
+
+ANTENNA = re.compile(r"[^.\s]")
+
+# Keeps only antenna coordinates and the map bounds, antinodes are packed y * width + x
+# ints in sets, so memory follows the number of antennae and antinodes instead of the area
+class SparseMap(Map):
+    def __init__(self, width, height, antennae):
+        self.width = width
+        self.height = height
+        self.antennae = antennae
+        self.antinodes = set()
+        self.resonant_antinodes = set()
+
+    @staticmethod
+    def load(file):
+        antennae = defaultdict(list)
+        width = height = 0
+        with open(file) as f:
+            for y, line in enumerate(f):
+                line = line.rstrip()
+                if not line:
+                    continue
+
+                width = max(width, len(line))
+                height = y + 1
+                for antenna in ANTENNA.finditer(line):
+                    antennae[antenna[0]].append((antenna.start(), y))
+
+        return SparseMap(width, height, antennae)
+
+    def mark(self, antinodes, x, y):
+        antinodes.add(y * self.width + x)
+
+    def count_antinodes(self, resonate = False):
+        return len(self.resonant_antinodes if resonate else self.antinodes)
+
+    def render(self, resonate = False):
+        rows = [[Map.NODE_SMYBOL] * self.width for _ in range(self.height)]
+        for antinode in (self.resonant_antinodes if resonate else self.antinodes):
+            y, x = divmod(antinode, self.width)
+            rows[y][x] = Map.ANTINODE_SYMBOL
+        for freq, positions in self.antennae.items():
+            for x, y in positions:
+                rows[y][x] = freq
+
+        return "\n".join("".join(row) for row in rows)
+
+if __name__ == "__main__":
+    map = SparseMap.load("8/input.txt")
+    map.run()
+    print(map.count_antinodes())
+    print(map.count_antinodes(True))
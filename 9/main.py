@@ -1,100 +1,81 @@
-class Chunk:
-    def __init__(self, size, id = None):
-        self.id = id
-        self.size = size
+import heapq
+from array import array
+
+FREE = -1
+MAX_SPAN = 9
 
-    def __str__(self):
-        symbol = "." if self.id is None else str(self.id)
-        return symbol * self.size
-    
 class Filesystem:
     def __init__(self, input_fn):
-        self.chunks = []
+        self.files = []
+        self.spaces = []
+        self.size = 0
         with open(input_fn) as f:
             is_file = True
-            id = 0
             for size in f.read().strip():
                 size = int(size)
-                if size > 0: 
-                    if is_file:
-                        self.chunks.append(Chunk(size, id))
-                        id += 1
-                    else:
-                        self.chunks.append(Chunk(size))
+                if is_file and size > 0:
+                    self.files.append((self.size, size))
+                elif not is_file:
+                    self.spaces.append((self.size, size))
+                self.size += size
 
                 is_file = not is_file
 
+    def blocks(self):
+        blocks = array("q", [FREE]) * self.size
+        for id, (start, size) in enumerate(self.files):
+            blocks[start:start + size] = array("q", [id]) * size
+
+        return blocks
+
     def __str__(self):
-        return "".join(str(chunk) for chunk in self.chunks)
-    
-    def checksum(self):
-        chksum = 0
-        i = 0
-        for chunk in self.chunks:
-            for i in range(i, i + chunk.size):
-                if chunk.id is not None:
-                    chksum += i * chunk.id
-                i += 1
-
-        return chksum
-    
-    def insert_chunk(self, index, chunk):
-            right_chunk = self.chunks[min(index, len(self.chunks) - 1)]
-            left_chunk = self.chunks[max(0, index - 1)]
-            if right_chunk.id == chunk.id:
-                right_chunk.size += chunk.size
-            elif left_chunk.id == chunk.id:
-                left_chunk.size += chunk.size
-            else:
-                self.chunks.insert(index, chunk)
-    
-    def swap(self, chunk1, chunk2, fragment):
-        if self.chunks.index(chunk1) > self.chunks.index(chunk2):
-            chunk1, chunk2 = chunk2, chunk1
-
-        if not fragment:
-            if chunk1.id is not None and chunk1.size > chunk2.size or \
-                chunk2.id is not None and chunk2.size > chunk1.size:
-                return False
-            
-        if chunk1.size == chunk2.size:
-            chunk1.id, chunk2.id = chunk2.id, chunk1.id
-        elif chunk1.size < chunk2.size:
-            chunk2.size = chunk2.size - chunk1.size
-            id = chunk1.id
-            chunk1.id = chunk2.id
-            self.insert_chunk(self.chunks.index(chunk2) + 1, Chunk(chunk1.size, id))
-        else:
-            chunk1.size = chunk1.size - chunk2.size
-            id = chunk2.id
-            chunk2.id = chunk1.id
-            self.insert_chunk(self.chunks.index(chunk1), Chunk(chunk2.size, id))
-
-        return True
-    
-    def compact(self, fragment = True):
-        right = len(self.chunks) - 1
-        while right >= 0:
-            right_chunk = self.chunks[right]
-            if right_chunk.id is None:
-                right -= 1
-                continue
+        return "".join("." if id == FREE else str(id) for id in self.blocks())
 
-            left = 0
-            while left < len(self.chunks) - 1 and (self.chunks[left].id is not None or \
-              (not fragment and self.chunks[left].size < right_chunk.size)):
-                left += 1
+    def checksum(self, files):
+        return sum(id * i for id, (start, size) in enumerate(files) for i in range(start, start + size))
 
-            if left >= right:
+    def compact_blocks(self):
+        blocks = self.blocks()
+        left = 0
+        right = len(blocks) - 1
+        while True:
+            while left < right and blocks[left] != FREE:
+                left += 1
+            while left < right and blocks[right] == FREE:
                 right -= 1
+            if left >= right:
+                break
+
+            blocks[left], blocks[right] = blocks[right], FREE
+
+        return sum(i * id for i, id in enumerate(blocks) if id != FREE)
+
+    # Free spans are kept in one min-heap of start offsets per span size, so the leftmost
+    # span a file fits in is the smallest head among the heaps at least as big as the file
+    def compact_files(self):
+        spans = [[] for _ in range(MAX_SPAN + 1)]
+        for start, size in self.spaces:
+            if size:
+                spans[size].append(start)
+
+        files = list(self.files)
+        for id in reversed(range(len(files))):
+            start, size = files[id]
+            fits = [span for span in range(max(size, 1), MAX_SPAN + 1) if spans[span] and spans[span][0] < start]
+            if not fits:
                 continue
 
-            left_chunk = self.chunks[left]
-            self.swap(left_chunk, right_chunk, fragment)
-            
-        return self.checksum()
+            span = min(fits, key = lambda span: spans[span][0])
+            new_start = heapq.heappop(spans[span])
+            files[id] = (new_start, size)
+            if span > size:
+                heapq.heappush(spans[span - size], new_start + size)
+
+        return self.checksum(files)
+
+    def compact(self, fragment = True):
+        return self.compact_blocks() if fragment else self.compact_files()
 
 fs = Filesystem("9/input.txt")
 print(fs.compact())
-fs = Filesystem("9/input.txt")
-print(fs.compact(False))
\ No newline at end of file
+print(fs.compact(False))
@@ -0,0 +1,171 @@
+import heapq
+import mmap
+import os
+
+ZERO = ord("0")
+MAX_SPAN = 9
+CHUNK_SIZE = 1024 * 1024
+SPAN_DIGITS = [bytes([ZERO + size]) for size in range(MAX_SPAN + 1)]
+
+# Sum of id * position over a run of `size` blocks starting at `start`
+def segment_checksum(id, start, size):
+    return id * (start * size + size * (size - 1) // 2)
+
+# Works on the dense disk map through a memory map, never expanding it into blocks
+class DiskMap:
+    def __init__(self, input_fn):
+        # An empty file can't be memory mapped, it is just a disk with nothing on it
+        with open(input_fn, "rb") as f:
+            empty = os.fstat(f.fileno()).st_size == 0
+            self.digits = None if empty else mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        self.length = 0 if empty else len(self.digits)
+        while self.length and not chr(self.digits[self.length - 1]).isdigit():
+            self.length -= 1
+
+        self.size = 0
+        self.files = 0
+        for offset in range(0, self.length, CHUNK_SIZE):
+            chunk = self.digits[offset:min(offset + CHUNK_SIZE, self.length)]
+            self.size += sum(chunk) - ZERO * len(chunk)
+            file_digits = chunk[offset % 2::2]
+            self.files += len(file_digits) - file_digits.count(b"0")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.digits is not None:
+            self.digits.close()
+
+    def __getitem__(self, i):
+        return self.digits[i] - ZERO
+
+    # Total size of the entries in digits[start:stop], read a chunk at a time
+    def blocks(self, start, stop):
+        total = 0
+        for offset in range(start, stop, CHUNK_SIZE):
+            chunk = self.digits[offset:min(offset + CHUNK_SIZE, stop)]
+            total += sum(chunk) - ZERO * len(chunk)
+        return total
+
+    # The first free span of `size` from index i (at block `position`) up to index `stop`,
+    # as its index and block position, or None if there isn't one
+    def next_span(self, size, i, position, stop):
+        while i < stop:
+            j = self.digits.find(SPAN_DIGITS[size], i, stop)
+            if j < 0:
+                return None
+
+            position += self.blocks(i, j)
+            if j % 2:
+                return j, position
+            i = j + 1
+            position += size
+
+        return None
+
+    def last_file(self, i):
+        i -= i % 2
+        while i >= 0 and self[i] == 0:
+            i -= 2
+        return i
+
+    # Free spans are filled from the far end while walking in from the front, so each
+    # piece of a file is added to the checksum as one segment the moment it is placed
+    def compact_blocks(self):
+        chksum = 0
+        position = 0
+        left_id = 0
+        right = self.last_file(self.length - 1)
+        right_id = self.files - 1
+        remaining = self[right] if right >= 0 else 0
+
+        i = 0
+        while i < right:
+            size = self[i]
+            if i % 2 == 0:
+                if size:
+                    chksum += segment_checksum(left_id, position, size)
+                    left_id += 1
+                    position += size
+            else:
+                while size and i < right:
+                    moved = min(size, remaining)
+                    chksum += segment_checksum(right_id, position, moved)
+                    position += moved
+                    size -= moved
+                    remaining -= moved
+
+                    if not remaining:
+                        right = self.last_file(right - 2)
+                        right_id -= 1
+                        remaining = self[right] if right > i else 0
+            i += 1
+
+        if i == right:
+            chksum += segment_checksum(right_id, position, remaining)
+
+        return chksum
+
+    # Every span size has a cursor on its leftmost unused free span, moved forward through the
+    # digits only when that span is taken, plus a heap for the space left over after a move.
+    # Files are moved right to left, so anything at or past the current file is dropped
+    def compact_files(self):
+        cursors = [self.next_span(span, 0, 0, self.length) if span else None for span in range(MAX_SPAN + 1)]
+        leftovers = [[] for _ in range(MAX_SPAN + 1)]
+        pruned = [0] * (MAX_SPAN + 1)
+
+        def head(span):
+            starts = []
+            if cursors[span] is not None:
+                starts.append(cursors[span][1])
+            if leftovers[span]:
+                starts.append(leftovers[span][0])
+            return min(starts, default = None)
+
+        chksum = 0
+        id = self.files
+        end = self.size
+        for i in reversed(range(self.length)):
+            size = self[i]
+            start = end - size
+            end = start
+            if i % 2 or not size:
+                continue
+
+            id -= 1
+            best = None
+            for span in range(size, MAX_SPAN + 1):
+                span_start = head(span)
+                if span_start is not None and span_start < start and (best is None or span_start < best[1]):
+                    best = span, span_start
+
+            if best is not None:
+                span, start = best
+                if cursors[span] is not None and cursors[span][1] == start:
+                    cursors[span] = self.next_span(span, cursors[span][0] + 1, start + span, i)
+                else:
+                    heapq.heappop(leftovers[span])
+                if span > size:
+                    heap = leftovers[span - size]
+                    heapq.heappush(heap, start + size)
+                    if len(heap) > 2 * max(pruned[span - size], MAX_SPAN):
+                        heap[:] = [leftover for leftover in heap if leftover < end]
+                        heapq.heapify(heap)
+                        pruned[span - size] = len(heap)
+
+            chksum += segment_checksum(id, start, size)
+
+        return chksum
+
+    def compact(self, fragment = True):
+        return self.compact_blocks() if fragment else self.compact_files()
+
+if __name__ == "__main__":
+    with DiskMap("9/input.txt") as disk_map:
+        print(disk_map.compact())
+        print(disk_map.compact(False))